@@ -5,6 +5,8 @@ Pymavi - Python SDK for the Mavi Video AI Platform
 __version__ = "0.1.0"
 
 from .client import MaviClient
+from .async_client import AsyncMaviClient
+from .h2_client import MaviClientH2
 from .exceptions import MaviError
 
-__all__ = ["MaviClient", "MaviError"] 
\ No newline at end of file
+__all__ = ["MaviClient", "AsyncMaviClient", "MaviClientH2", "MaviError"] 
\ No newline at end of file
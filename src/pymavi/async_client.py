@@ -0,0 +1,451 @@
+"""Asynchronous Mavi API Client implementation."""
+
+import asyncio
+import logging
+import time
+from typing import List, Optional, Dict, AsyncGenerator, Tuple, Any, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+import orjson
+
+from .client import MaviClient, _EMPTY_LIST, _UNSUPPORTED_STATUSES, _decode_event, _status_error, _videos_by_id
+from .exceptions import *
+
+logger = logging.getLogger(__name__)
+
+class AsyncMaviClient:
+    """Asynchronous client for interacting with the Mavi Video AI Platform API.
+
+    Provides the upload, search, chat, transcription and delete methods of
+    :class:`MaviClient` as coroutines so that independent requests can be issued
+    concurrently, e.g. with ``asyncio.gather``. ``delete_videos_bulk`` takes the place of
+    ``delete_videos_parallel``; ``upload_video_by_path`` and the search_video_metadata
+    cache are only available on :class:`MaviClient`. Requires the optional ``aiohttp``
+    dependency (``pip install pymavi[async]``).
+
+    Example:
+        async with AsyncMaviClient(api_key) as client:
+            results = await asyncio.gather(*(client.search_video(q) for q in queries))
+
+    Attributes:
+        api_key (str): The API key for authentication
+        base_url (str): The base URL for the Mavi API
+    """
+
+    HOUR_SECONDS = MaviClient.HOUR_SECONDS
+    WEEK_MS = MaviClient.WEEK_MS
+    DEFAULT_BASE_URL = MaviClient.DEFAULT_BASE_URL
+    _ENDPOINTS = MaviClient._ENDPOINTS
+    CONNECTION_LIMIT = 20
+    CONNECTION_LIMIT_PER_HOST = 10
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        """Initialize the asynchronous Mavi client.
+
+        Args:
+            api_key (str): Your Mavi API key
+            base_url (str, optional): Custom base URL for the API. Defaults to the standard URL.
+
+        Raises:
+            MaviValidationError: If the API key is empty or invalid
+            MaviError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise MaviError("AsyncMaviClient requires aiohttp. Install it with `pip install pymavi[async]`")
+        if not api_key or not isinstance(api_key, str):
+            raise MaviValidationError("API key must be a non-empty string")
+
+        self.api_key = api_key
+        self.base_url = base_url or self.DEFAULT_BASE_URL
+        self._session = None
+
+    @property
+    def base_url(self) -> str:
+        """The base URL for the Mavi API."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, base_url: str) -> None:
+        self._base_url = base_url
+        base = base_url.rstrip('/')
+        self._urls = {endpoint: f"{base}/{endpoint}" for endpoint in self._ENDPOINTS}
+        # Anything learned about the previous server no longer applies
+        self._batch_search_supported = True
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it inside the running event loop if needed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"Authorization": self.api_key},
+                connector=aiohttp.TCPConnector(
+                    limit=self.CONNECTION_LIMIT,
+                    limit_per_host=self.CONNECTION_LIMIT_PER_HOST
+                ),
+                timeout=aiohttp.ClientTimeout(total=None),
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session and release its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncMaviClient":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        allowed_statuses: Tuple[int, ...] = (),
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """Make an HTTP request to the Mavi API.
+
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            endpoint (str): API endpoint to call, one of _ENDPOINTS
+            allowed_statuses (tuple, optional): Error statuses to return None for instead of raising
+            params (dict, optional): Query parameters; entries set to None are dropped
+            **kwargs: Additional arguments to pass to aiohttp
+
+        Returns:
+            Dict[str, Any]: JSON response from the API, or None if the status is in allowed_statuses
+
+        Raises:
+            MaviAuthenticationError: If authentication fails
+            MaviAPIError: If the API request fails
+        """
+        if params is not None:
+            # aiohttp rejects None query values, requests silently drops them
+            params = {k: v for k, v in params.items() if v is not None}
+
+        url = self._urls[endpoint]
+        logger.debug("mavi request %s %s params=%s", method, url, params)
+        try:
+            async with self._get_session().request(method, url, params=params, **kwargs) as response:
+                body = await response.read()
+                if response.status in allowed_statuses:
+                    return None
+                if response.status >= 400:
+                    raise _status_error(response.status, body.decode(errors="replace"))
+                return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            raise MaviAPIError("Failed to decode JSON response") from None
+        except aiohttp.ClientError as e:
+            raise MaviAPIError(f"Request failed: {str(e)}") from e
+
+    async def upload_video(
+        self,
+        video_path: str,
+        callback_uri: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Upload a video to the Mavi platform.
+
+        Args:
+            video_path (str): Path to the video file
+            callback_uri (str, optional): Public callback URL for processing results
+
+        Returns:
+            tuple: A tuple containing the video ID and the video name assigned by Mavi
+
+        Raises:
+            MaviValidationError: If the video file doesn't exist or is invalid
+            MaviAPIError: If the upload fails
+        """
+        try:
+            with open(video_path, "rb") as video_file:
+                form = aiohttp.FormData()
+                form.add_field("file", video_file, filename=video_file.name, content_type="video/mp4")
+                params = {"callBackUri": callback_uri}
+                content = await self._make_request("POST", "upload", data=form, params=params)
+                return (content['data']['videoNo'], content['data']['videoName'])
+        except FileNotFoundError:
+            raise MaviValidationError(f"Video file not found: {video_path}")
+
+    async def upload_video_from_url(
+        self,
+        video_url: str,
+        callback_uri: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Upload a video from a URL to the Mavi platform.
+
+        Args:
+            video_url (str): URL of the video file
+            callback_uri (str, optional): Public callback URL for processing results
+
+        Returns:
+            tuple: A tuple containing the video ID and the video name assigned by Mavi
+        """
+        data = {
+            "url": video_url,
+        }
+        params = {
+            "callBackUri": callback_uri
+        }
+
+        content = await self._make_request("POST", "uploadUrl", json=data, params=params)
+        return (content['data']['videoNo'], content['data']['videoName'])
+
+    async def search_video_metadata(
+        self,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        video_status: Optional[str] = "PARSE",
+        video_name: Optional[str] = None,
+        range_bucket: Optional[int] = 1,
+        num_results: Optional[int] = 10
+    ) -> Dict[str, Any]:
+        """Searches the Mavi database for videos matching the given specifications.
+
+        See :meth:`MaviClient.search_video_metadata` for the argument and result format.
+        """
+        if start_time is None or end_time is None:
+            now = int(time.time() * 1000)
+            if start_time is None:
+                start_time = now - self.WEEK_MS # 1 week ago
+            if end_time is None:
+                end_time = now
+
+        params = {
+            "startTime": start_time,
+            "endTime": end_time,
+            "videoStatus": video_status,
+            "videoName": video_name if video_name else None,
+            "page": range_bucket,
+            "pageSize": num_results
+        }
+
+        content = await self._make_request("GET", "searchDB", params=params)
+
+        return _videos_by_id(content['data']['videoData'])
+
+    async def search_video(
+        self,
+        search_query: str,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Searches all videos from a natural language query.
+
+        See :meth:`MaviClient.search_video` for the argument and result format.
+        """
+        data = {
+            "searchValue": search_query,
+            "limit": limit if limit else None
+            }
+        content = await self._make_request("POST", "searchAI", json=data)
+        return _videos_by_id(content['data']['videos'])
+
+    async def search_videos_batch(
+        self,
+        queries: List[str],
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Runs several natural language video searches at once.
+
+        The queries are sent in a single request when the server supports batch search.
+        Otherwise they are sent as concurrent search_video requests.
+
+        See :meth:`MaviClient.search_videos_batch` for the argument and result format.
+        """
+        if self._batch_search_supported:
+            data = {
+                "queries": queries,
+                "limit": limit if limit else None
+            }
+            content = await self._make_request(
+                "POST", "searchAI/batch", allowed_statuses=_UNSUPPORTED_STATUSES, json=data
+            )
+            if content is not None:
+                return [_videos_by_id(result['videos']) for result in content['data']['results']]
+            logger.debug("searchAI/batch not supported, searching concurrently instead")
+            self._batch_search_supported = False
+
+        return list(await asyncio.gather(*(self.search_video(query, limit) for query in queries)))
+
+    async def search_key_clip(
+        self,
+        search_query: str,
+        video_ids: List[str],
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieves the most relevant clips within one or multiple videos provided, sorted by relevance.
+
+        See :meth:`MaviClient.search_key_clip` for the argument and result format.
+        """
+        data = {
+            "videoNos": video_ids,
+            "searchValue": search_query,
+            "limit": limit if limit else None
+        }
+        content = await self._make_request("POST", "searchVideoFragment", json=data)
+
+        clips = [
+            {
+                "videoNo": clip['videoNo'],
+                "videoName": clip['videoName'],
+                "fragmentStartTime": clip['fragmentStartTime'],
+                "fragmentEndTime": clip['fragmentEndTime'],
+                "duration": clip['duration'],
+            }
+            for clip in content['data']['videos']
+        ]
+        return clips
+
+    async def chat_with_videos(
+        self,
+        video_nos: List[str],
+        message: str,
+        history: Optional[List[Dict[str, str]]] = None,
+        stream: bool = False
+    ) -> Union[str, AsyncGenerator[str, None]]:
+        """Chat with an AI assistant about specific videos.
+
+        Args:
+            video_nos (List[str]): List of video IDs to chat about
+            message (str): Message to send to the AI assistant
+            history (List[Dict[str, str]], optional): Chat history for context, default is None
+            stream (bool, optional): Whether to stream the response, default is False
+
+        Returns:
+            Union[str, AsyncGenerator]: The AI assistant's response, or an async generator
+                yielding chunks of it when streaming
+
+        Raises:
+            MaviAPIError: If the request fails or the assistant returns an error
+        """
+        data = {
+            "videoNos": video_nos,
+            "message": message,
+            "history": history or _EMPTY_LIST,
+            "stream": stream
+        }
+        if stream:
+            return self._stream_response(data)
+        return await self._get_full_response(data)
+
+    async def _get_full_response(
+        self,
+        data: Dict[str, Any]
+    ) -> str:
+        """Helper method to handle non-streaming responses
+
+        Args:
+            data (Dict[str, Any]): Data to send in the request
+
+        Returns:
+            str: The full response from the AI assistant
+
+        Raises:
+            MaviAPIError: If the request fails or the assistant returns an error
+        """
+        url = self._urls["chat"]
+        logger.debug("mavi request POST %s", url)
+        try:
+            async with self._get_session().post(url, json=data) as response:
+                body = await response.read()
+                if response.status >= 400:
+                    raise _status_error(response.status, body.decode(errors="replace"))
+        except aiohttp.ClientError as e:
+            raise MaviAPIError(f"Request failed: {str(e)}") from e
+        # The whole body is a single "data:{...}" event
+        return _decode_event(body) or ""
+
+    async def _stream_response(
+        self,
+        data: Dict[str, Any]
+    ) -> AsyncGenerator[str, None]:
+        """Helper method to read the chat response one "data:" event at a time
+
+        Args:
+            data (Dict[str, Any]): Data to send in the request
+
+        Returns:
+            AsyncGenerator[str]: An async generator yielding chunks of the response
+        """
+        url = self._urls["chat"]
+        logger.debug("mavi request POST %s (stream)", url)
+        try:
+            async with self._get_session().post(url, json=data) as response:
+                if response.status >= 400:
+                    raise _status_error(response.status, await response.text())
+                async for line in response.content:
+                    message = _decode_event(line)
+                    if message is not None:
+                        yield message
+        except aiohttp.ClientError as e:
+            raise MaviAPIError(f"Request failed: {str(e)}") from e
+
+    async def transcribe_video(
+        self,
+        video_id: str,
+        transcribe_type: str = "AUDIO",
+        callback_uri: Optional[str] = None
+    ) -> str:
+        """Request an AUDIO or VIDEO transcription of an uploaded video.
+
+        See :meth:`MaviClient.transcribe_video` for the argument format.
+
+        Returns:
+            str: The task ID for the transcription request
+        """
+        data = {
+            "videoNo": video_id,
+            "type": transcribe_type,
+            "callBackUri": callback_uri if callback_uri else None
+        }
+
+        content = await self._make_request("POST", "subTranscription", json=data)
+        return content['data']['taskNo']
+
+    async def get_transcription(
+        self,
+        taskNo: str
+    ) -> Dict[str, Any]:
+        """Get the transcription results for a given task ID.
+
+        See :meth:`MaviClient.get_transcription` for the result format.
+        """
+        params = {
+            "taskNo": taskNo
+        }
+
+        content = await self._make_request("GET", "getTranscription", params=params)
+        return content['data']
+
+    async def delete_video(
+        self,
+        video_ids: List[str]
+    ) -> None:
+        """Delete videos from the Mavi platform.
+
+        Args:
+            video_ids (List[str]): List of video IDs to delete
+
+        Returns:
+            None
+        """
+        await self._make_request("DELETE", "delete", json=video_ids)
+
+    async def delete_videos_bulk(
+        self,
+        video_ids: List[str]
+    ) -> None:
+        """Delete videos from the Mavi platform, issuing one concurrent request per video.
+
+        Args:
+            video_ids (List[str]): List of video IDs to delete
+
+        Returns:
+            None
+        """
+        await asyncio.gather(*(self.delete_video([video_id]) for video_id in video_ids))
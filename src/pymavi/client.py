@@ -1,12 +1,109 @@
 """Mavi API Client implementation."""
 
+import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union, Dict, Generator, Tuple, Any
 import requests
-import json
+import orjson
+from cachetools import TLRUCache
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
 from .exceptions import *
 
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared immutable default for empty request lists; serializes to a JSON array
+_EMPTY_LIST = ()
+
+# Statuses with which a server without an optional endpoint answers calls to it
+_UNSUPPORTED_STATUSES = (404, 501)
+
+def _status_error(status_code: int, text: str) -> MaviError:
+    """Map an HTTP error status returned by the Mavi API to the matching exception.
+    
+    Args:
+        status_code (int): HTTP status code of the failed response
+        text (str): Body of the failed response
+        
+    Returns:
+        MaviError: The exception to raise for this status
+    """
+    if status_code == 401:
+        return MaviAuthenticationError("Invalid API key")
+    if status_code == 429:
+        return MaviBusySystemError("Mavi server is busy, please try again later")
+    if status_code == 409:
+        return MaviDuplicateError("Duplicate request detected")
+    if status_code == 403:
+        return MaviDisabledAccountError("Your account is disabled. Please contact support.")
+    return MaviAPIError(f"API request failed: {text}")
+
+def _decode_event(line: Union[bytes, str]) -> Optional[str]:
+    """Decode one "data:{...}" event of a chat response into the message it carries.
+    
+    Args:
+        line (bytes or str): A line of the response body
+        
+    Returns:
+        str, optional: The message of the event, or None for separator and keep-alive lines
+        
+    Raises:
+        MaviAPIError: If the event is not valid JSON or reports an error
+    """
+    prefix = b"data:" if isinstance(line, bytes) else "data:"
+    if line.startswith(prefix):
+        line = line[5:]
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        event = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        raise MaviAPIError("Failed to decode JSON response") from None
+    if event.get('code') != '0000':
+        raise MaviAPIError(f"Chat request failed: {event.get('code', '')} {event.get('msg', '')}")
+    return event.get('data', {}).get('msg', "")
+
+def _videos_by_id(video_data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index the videos returned by a search endpoint by their ID, keeping the metadata callers use."""
+    return {
+        vid['videoNo']: {
+            "videoName": vid['videoName'],
+            "videoStatus": vid['videoStatus'],
+            "uploadTime": vid['uploadTime']
+        }
+        for vid in video_data
+    }
+
+def _cache_max_age(cache_control: Optional[str]) -> Optional[float]:
+    """Read how long a response may be cached from its Cache-Control header.
+    
+    Args:
+        cache_control (str, optional): Value of the Cache-Control response header
+        
+    Returns:
+        float, optional: Seconds the response may be cached for, 0 if it must not be
+            cached, or None if the header does not say
+    """
+    if not cache_control:
+        return None
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in ("no-store", "no-cache"):
+            return 0
+        if name == "max-age":
+            try:
+                return max(float(value.strip('" ')), 0)
+            except ValueError:
+                return None
+    return None
+
 class MaviClient:
     """Client for interacting with the Mavi Video AI Platform API.
     
@@ -20,14 +117,30 @@ class MaviClient:
     """
     
     HOUR_SECONDS = 3600
+    WEEK_MS = HOUR_SECONDS * 24 * 7 * 1000
     DEFAULT_BASE_URL = "https://mavi-backend.openinterx.com/api/serve/video/"
+    _ENDPOINTS = (
+        "upload", "uploadUrl", "searchDB", "searchAI", "searchVideoFragment",
+        "chat", "subTranscription", "getTranscription", "delete", "importLocal",
+        "searchAI/batch"
+    )
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+    RETRY_TOTAL = 5
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+    STREAM_CHUNK_SIZE = 64 * 1024
+    METADATA_CACHE_SIZE = 256
+    BATCH_MAX_WORKERS = 8
     
-    def __init__(self, api_key: str, base_url: Optional[str] = None):
+    def __init__(self, api_key: str, base_url: Optional[str] = None, cache_ttl: float = 30):
         """Initialize the Mavi client.
         
         Args:
             api_key (str): Your Mavi API key
             base_url (str, optional): Custom base URL for the API. Defaults to the standard URL.
+            cache_ttl (float, optional): Seconds to cache identical search_video_metadata results
+                for when the server sends no Cache-Control max-age, default is 30. 0 disables the cache.
         
         Raises:
             MaviValidationError: If the API key is empty or invalid
@@ -36,52 +149,176 @@ class MaviClient:
             raise MaviValidationError("API key must be a non-empty string")
             
         self.api_key = api_key
+        self.cache_ttl = cache_ttl
+        # Entries are (ttl, stored_at, videos) so each can expire after its own TTL and
+        # calls with a shorter cache_ttl can reject older ones
+        self._metadata_cache = TLRUCache(
+            maxsize=self.METADATA_CACHE_SIZE,
+            ttu=lambda key, value, now: now + value[0]
+        )
+        self._metadata_cache_lock = threading.Lock()
+        self.session = None
         self.base_url = base_url or self.DEFAULT_BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({"Authorization": self.api_key})
+        self.session = self._create_session()
     
-    def _make_request(
+    @property
+    def base_url(self) -> str:
+        """The base URL for the Mavi API."""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, base_url: str) -> None:
+        self._base_url = base_url
+        base = base_url.rstrip('/')
+        self._urls = {endpoint: f"{base}/{endpoint}" for endpoint in self._ENDPOINTS}
+        # Anything learned about the previous server no longer applies
+        self._batch_search_supported = True
+        self._invalidate_metadata_cache()
+        if self.session is not None:
+            self._mount_endpoint_adapters(self.session)
+    
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session shared by all requests of this client.
+        
+        Returns:
+            requests.Session: A session with the Authorization header set and pooled,
+                retrying adapters mounted
+        """
+        session = requests.Session()
+        session.headers.update({"Authorization": self.api_key})
+        # Transient failures and busy responses are retried with exponential backoff,
+        # honoring Retry-After. The final response is returned rather than raised so
+        # _make_request can still map it to the matching MaviError.
+        retry = Retry(
+            total=self.RETRY_TOTAL,
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            status_forcelist=self.RETRY_STATUS_FORCELIST,
+            allowed_methods=["GET", "POST", "DELETE"],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self._retry_adapter = adapter
+        # Uploads stream their body from disk and cannot be rewound for a retry
+        self._upload_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_MAXSIZE)
+        self._endpoint_mounts = ()
+        self._mount_endpoint_adapters(session)
+        return session
+    
+    def _mount_endpoint_adapters(self, session: requests.Session) -> None:
+        """Mount the adapters of endpoints that need their own, replacing earlier mounts.
+        
+        Args:
+            session (requests.Session): The session created by _create_session
+        """
+        for prefix in self._endpoint_mounts:
+            session.adapters.pop(prefix, None)
+        # Adapters match by URL prefix, longest first, so uploadUrl is mounted back
+        # on the retrying adapter
+        session.mount(self._urls["upload"], self._upload_adapter)
+        session.mount(self._urls["uploadUrl"], self._retry_adapter)
+        self._endpoint_mounts = (self._urls["upload"], self._urls["uploadUrl"])
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> "MaviClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _invalidate_metadata_cache(self) -> None:
+        """Drop cached search_video_metadata results after a call that adds or removes videos."""
+        with self._metadata_cache_lock:
+            self._metadata_cache.clear()
+    
+    def _send(
         self,
         method: str,
         endpoint: str,
+        allowed_statuses: Tuple[int, ...] = (),
         **kwargs
-    ) -> Dict[str, Any]:
-        """Make an HTTP request to the Mavi API.
+    ) -> requests.Response:
+        """Send an HTTP request to the Mavi API and check its status.
         
         Args:
             method (str): HTTP method (GET, POST, etc.)
-            endpoint (str): API endpoint to call
+            endpoint (str): API endpoint to call, one of _ENDPOINTS
+            allowed_statuses (tuple, optional): Error statuses to return to the caller instead of raising
             **kwargs: Additional arguments to pass to requests
             
         Returns:
-            Dict[str, Any]: JSON response from the API
+            requests.Response: The successful response, or one with a status in allowed_statuses
             
         Raises:
             MaviAuthenticationError: If authentication fails
             MaviAPIError: If the API request fails
         """
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        url = self._urls[endpoint]
         
+        if "json" in kwargs:
+            # Serialize with orjson rather than letting requests use the stdlib encoder
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**kwargs.get("headers", {}), **_JSON_HEADERS}
+        
+        logger.debug("mavi request %s %s params=%s", method, url, kwargs.get("params"))
         try:
             response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
-            response = response.json()
+            if response.status_code not in allowed_statuses:
+                response.raise_for_status()
             return response
-        except json.JSONDecodeError:
-            raise MaviAPIError("Failed to decode JSON response") from None
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 401:
-                raise MaviAuthenticationError("Invalid API key") from e
-            if response.status_code == 429:
-                raise MaviBusySystemError("Mavi server is busy, please try again later") from e
-            if response.status_code == 409:
-                raise MaviDuplicateError("Duplicate request detected") from e
-            if response.status_code == 403:
-                raise MaviDisabledAccountError("Your account is disabled. Please contact support.") from e
-            raise MaviAPIError(f"API request failed: {response.text}") from e
+            raise _status_error(response.status_code, response.text) from e
         except requests.exceptions.RequestException as e:
             raise MaviAPIError(f"Request failed: {str(e)}") from e
     
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Make an HTTP request to the Mavi API.
+        
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            endpoint (str): API endpoint to call, one of _ENDPOINTS
+            **kwargs: Additional arguments to pass to requests
+            
+        Returns:
+            Dict[str, Any]: JSON response from the API
+            
+        Raises:
+            MaviAuthenticationError: If authentication fails
+            MaviAPIError: If the API request fails
+        """
+        return self._decode(self._send(method, endpoint, **kwargs))
+    
+    @staticmethod
+    def _decode(response: requests.Response) -> Dict[str, Any]:
+        """Decode the JSON body of a Mavi API response.
+        
+        Args:
+            response (requests.Response): A successful response from _send
+            
+        Returns:
+            Dict[str, Any]: JSON response from the API
+            
+        Raises:
+            MaviAPIError: If the body is not valid JSON
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            raise MaviAPIError("Failed to decode JSON response") from None
+    
     def upload_video(
         self,
         video_path: str,
@@ -100,15 +337,83 @@ class MaviClient:
             MaviValidationError: If the video file doesn't exist or is invalid
             MaviAPIError: If the upload fails
         """
+        video = self._upload_file(video_path, None, callback_uri)
+        self._invalidate_metadata_cache()
+        return video
+    
+    def _upload_file(
+        self,
+        video_path: str,
+        file_name: Optional[str],
+        callback_uri: Optional[str]
+    ) -> Tuple[str, str]:
+        """Helper method to upload a local video file
+        
+        Args:
+            video_path (str): Path to the video file
+            file_name (str, optional): File name to send for the video, default is video_path
+            callback_uri (str, optional): Public callback URL for processing results
+            
+        Returns:
+            tuple: A tuple containing the video ID and the video name assigned by Mavi
+        """
         try:
             with open(video_path, "rb") as video_file:
-                files = {"file": (video_file.name, video_file, "video/mp4")}
+                # Stream the multipart body from disk instead of building it in memory
+                encoder = MultipartEncoder(fields={"file": (file_name or video_file.name, video_file, "video/mp4")})
                 params = {"callBackUri": callback_uri} if callback_uri else None
-                content = self._make_request("POST", "upload", files=files, params=params)
+                content = self._make_request(
+                    "POST", "upload",
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
+                    params=params
+                )
                 return (content['data']['videoNo'], content['data']['videoName'])
         except FileNotFoundError:
             raise MaviValidationError(f"Video file not found: {video_path}")
     
+    def upload_video_by_path(
+        self,
+        video_name: str,
+        remote_path: str,
+        callback_uri: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Import a video that is already on the Mavi server's filesystem, skipping the upload.
+        
+        This only works on deployments (e.g. on-premises) where the Mavi server can read
+        remote_path directly. If the server does not support importing by path but the
+        same path exists on this machine, the file is uploaded from here under video_name
+        instead.
+        
+        Args:
+            video_name (str): Name to give the video
+            remote_path (str): Path of the video file on the Mavi server
+            callback_uri (str, optional): Public callback URL for processing results
+            
+        Returns:
+            tuple: A tuple containing the video ID and the video name assigned by Mavi
+            
+        Raises:
+            MaviAPIError: If the import fails
+        """
+        data = {
+            "videoName": video_name,
+            "path": remote_path,
+            "callBackUri": callback_uri if callback_uri else None
+        }
+        
+        response = self._send("POST", "importLocal", allowed_statuses=_UNSUPPORTED_STATUSES, json=data)
+        if response.status_code in _UNSUPPORTED_STATUSES:
+            if not os.path.isfile(remote_path):
+                raise _status_error(response.status_code, response.text)
+            logger.debug("importLocal not supported, uploading %s instead", remote_path)
+            video = self._upload_file(remote_path, video_name, callback_uri)
+        else:
+            content = self._decode(response)
+            video = (content['data']['videoNo'], content['data']['videoName'])
+        self._invalidate_metadata_cache()
+        return video
+    
     def upload_video_from_url(
         self,
         video_url: str,
@@ -136,6 +441,7 @@ class MaviClient:
         }            
         
         content = self._make_request("POST", "uploadUrl", json=data, params=params)
+        self._invalidate_metadata_cache()
         return (content['data']['videoNo'], content['data']['videoName'])
     
     def search_video_metadata(
@@ -145,7 +451,8 @@ class MaviClient:
         video_status: Optional[str] = "PARSE",
         video_name: Optional[str] = None,
         range_bucket: Optional[int] = 1,
-        num_results: Optional[int] = 10
+        num_results: Optional[int] = 10,
+        cache_ttl: Optional[float] = None
     ) -> Dict[str, Any]:
         """Searches the Mavi database for videos matching the given specifications.
         
@@ -158,6 +465,9 @@ class MaviClient:
             page (int, optional): The range bucket for the search, default is 1. 
                 The page is which “page” of results to return. I.e., if num_results=10,
                 page=2, the function will return results 10-19.
+            cache_ttl (float, optional): Seconds to cache this result for when the server sends
+                no Cache-Control max-age, and the maximum age of a cached result this call
+                accepts. Default is the client's cache_ttl. 0 skips the cache for this call.
         
         Returns:
             dict: A dictionary indexed by the video IDs and containing their metadata as a dictionary
@@ -171,11 +481,32 @@ class MaviClient:
             
             This will search for videos that were uploaded between 2 hours ago and now, that are
             finished processing, and will return results 20-39.
+            
+        Note:
+            Results are cached per set of arguments for the server's Cache-Control max-age,
+            or for cache_ttl if the server sends none. A cache_ttl passed to this call also
+            rejects cached results older than it. Calls that leave start_time or end_time at
+            the default always reach the server and are not cached, as the window moves with
+            the clock.
         """
-        if start_time is None:
-            start_time = int((time.time() - self.HOUR_SECONDS * 24 * 7) * 1000) # 1 week ago
-        if end_time is None:
-            end_time = int(time.time() * 1000) # now
+        max_age = cache_ttl
+        if cache_ttl is None:
+            cache_ttl = self.cache_ttl
+        # A defaulted window ends at the current time and can never be looked up again
+        use_cache = cache_ttl > 0 and start_time is not None and end_time is not None
+        if start_time is None or end_time is None:
+            now = int(time.time() * 1000)
+            if start_time is None:
+                start_time = now - self.WEEK_MS # 1 week ago
+            if end_time is None:
+                end_time = now
+            
+        key = (start_time, end_time, video_status, video_name, range_bucket, num_results)
+        if use_cache:
+            with self._metadata_cache_lock:
+                cached = self._metadata_cache.get(key)
+            if cached is not None and (max_age is None or time.monotonic() - cached[1] <= max_age):
+                return {video_no: dict(meta) for video_no, meta in cached[2].items()}
             
         params = {
             "startTime": start_time,
@@ -186,15 +517,19 @@ class MaviClient:
             "pageSize": num_results
         }
         
-        content = self._make_request("GET", "searchDB", params=params)
+        response = self._send("GET", "searchDB", params=params)
+        content = self._decode(response)
     
-        videos = dict()
-        for vid in content['data']['videoData']:
-            videos[vid['videoNo']] = {
-                "videoName": vid['videoName'],
-                "videoStatus": vid['videoStatus'],
-                "uploadTime": vid['uploadTime']
-            }
+        videos = _videos_by_id(content['data']['videoData'])
+        
+        if use_cache:
+            ttl = _cache_max_age(response.headers.get("Cache-Control"))
+            if ttl is None:
+                ttl = cache_ttl
+            if ttl > 0:
+                copy = {video_no: dict(meta) for video_no, meta in videos.items()}
+                with self._metadata_cache_lock:
+                    self._metadata_cache[key] = (ttl, time.monotonic(), copy)
         return videos
     
     def search_video(
@@ -223,14 +558,40 @@ class MaviClient:
             "limit": limit if limit else None
             }
         content = self._make_request("POST", "searchAI", json=data)
-        videos = dict()
-        for vid in content['data']['videos']:
-            videos[vid['videoNo']] = {
-                "videoName": vid['videoName'],
-                "videoStatus": vid['videoStatus'],
-                "uploadTime": vid['uploadTime']
+        return _videos_by_id(content['data']['videos'])
+    
+    def search_videos_batch(
+        self,
+        queries: List[str],
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Runs several natural language video searches at once.
+        
+        The queries are sent in a single request when the server supports batch search.
+        Otherwise they are sent as concurrent search_video requests over the client's
+        pooled connections.
+        
+        Args:
+            queries (List[str]): The natural language queries used to search the videos
+            limit (int, optional): The maximum number of results to return per query, default is None for all results
+            
+        Returns:
+            list: One dictionary per query, in the same order, formatted as returned by search_video
+        """
+        if self._batch_search_supported:
+            data = {
+                "queries": queries,
+                "limit": limit if limit else None
             }
-        return videos
+            response = self._send("POST", "searchAI/batch", allowed_statuses=_UNSUPPORTED_STATUSES, json=data)
+            if response.status_code not in _UNSUPPORTED_STATUSES:
+                content = self._decode(response)
+                return [_videos_by_id(result['videos']) for result in content['data']['results']]
+            logger.debug("searchAI/batch not supported, searching concurrently instead")
+            self._batch_search_supported = False
+        
+        with ThreadPoolExecutor(max_workers=self.BATCH_MAX_WORKERS) as executor:
+            return list(executor.map(lambda query: self.search_video(query, limit), queries))
     
     def search_key_clip(
         self,
@@ -259,15 +620,16 @@ class MaviClient:
         }
         content = self._make_request("POST", "searchVideoFragment", json=data)
         
-        clips = []
-        for clip in content['data']['videos']:
-            clips.append({
+        clips = [
+            {
                 "videoNo": clip['videoNo'],
                 "videoName": clip['videoName'],
                 "fragmentStartTime": clip['fragmentStartTime'],
                 "fragmentEndTime": clip['fragmentEndTime'],
                 "duration": clip['duration'],
-            })
+            }
+            for clip in content['data']['videos']
+        ]
         return clips
     
     def chat_with_videos(
@@ -287,26 +649,28 @@ class MaviClient:
             
         Returns:
             Union[str, Generator]: The AI assistant's response or a generator for streaming responses
+            
+        Raises:
+            MaviAPIError: If the request fails or the assistant returns an error. When streaming,
+                this is raised while iterating over the generator.
         """
         
-        url = self.base_url + "chat"
-        headers = {"Authorization": self.api_key}
+        url = self._urls["chat"]
             
         data = {
             "videoNos": video_nos,
             "message": message,
-            "history": history or [],
+            "history": history or _EMPTY_LIST,
             "stream": stream
         }
         if stream:
-            return self._stream_response(url, headers, data)
+            return self._stream_response(url, data)
         else:
-            return self._get_full_response(url, headers, data)
+            return self._get_full_response(data)
     
     def _stream_response(
         self,
         url: str,
-        headers: Dict[str, str],
         data: Dict[str, Any]
     ) -> Generator[str, None, None]:
         """Helper method to handle streaming responses
@@ -316,49 +680,42 @@ class MaviClient:
             
         Returns:
             Generator[str]: A generator yielding chunks of the response
+            
+        Raises:
+            MaviAPIError: If the request fails or the assistant returns an error
         """
+        logger.debug("mavi request POST %s (stream)", url)
+        response = None
         try:
-            response = requests.post(url, json=data, headers=headers, stream=True)
-            response.raise_for_status()
-
-            # Accumulate chunks into a buffer
-            buffer = ""
-            for chunk in response.iter_content(chunk_size=1024):
-                if chunk:  # Filter out keep-alive new chunks
-                    try:
-                        # Decode the chunk as UTF-8 and add it to the buffer
-                        decoded_chunk = chunk.decode('utf-8').strip()
-                        buffer += decoded_chunk
-                        
-                        # Remove the "data:" prefix if it exists
-                        if buffer.startswith("data:"):
-                            buffer = buffer[5:].strip()
+            response = self.session.post(url, data=orjson.dumps(data), headers=_JSON_HEADERS, stream=True)
+            if response.status_code >= 400:
+                raise _status_error(response.status_code, response.text)
 
-                        # Attempt to parse the buffer as JSON
-                        while True:
-                            try:
-                                json_data, index = json.JSONDecoder().raw_decode(buffer)
-                                buffer = buffer[index:].strip()  # Remove the parsed part from the buffer
-                                # Process JSON data
-                                if json_data.get('code') != '0000':
-                                    return json_data.get('code', ""), json_data.get('msg', "")
-                                else:
-                                    yield json_data.get('data', {}).get('msg', "")
-                            except json.JSONDecodeError:
-                                # Wait for more chunks if JSON is incomplete
-                                break
-                    except UnicodeDecodeError:
-                        continue # Skip invalid UTF-8 sequences
+            # Each server-sent event is a single "data:{...}" line, so only complete
+            # events are ever decoded. read1 returns whatever has arrived (up to
+            # STREAM_CHUNK_SIZE) rather than waiting for a full chunk, so events are
+            # yielded as they come in even when the stream is not chunk-encoded.
+            pending = b""
+            while True:
+                chunk = response.raw.read1(self.STREAM_CHUNK_SIZE, decode_content=True)
+                if not chunk:
+                    break
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    message = _decode_event(line)
+                    if message is not None:
+                        yield message
+            message = _decode_event(pending)
+            if message is not None:
+                yield message
         except requests.exceptions.RequestException as e:
-            return e
+            raise MaviAPIError(f"Request failed: {str(e)}") from e
         finally:
-            if 'response' in locals():
+            if response is not None:
                 response.close()
     
     def _get_full_response(
         self,
-        url: str,
-        headers: Dict[str, str],
         data: Dict[str, Any]
     ) -> str:
         """Helper method to handle non-streaming responses
@@ -368,24 +725,14 @@ class MaviClient:
             
         Returns:
             str: The full response from the AI assistant
+            
+        Raises:
+            MaviAPIError: If the request fails or the assistant returns an error
         """
-        try:
-            response = requests.post(url, json=data, headers=headers)
-            response.raise_for_status()
-            
-            # Remove the "data:" prefix if it exists
-            if response.text.startswith("data:"):
-                content = response.text[5:].strip()
-            else:
-                content = response.text
-            content = json.loads(content)
-            if content.get('code') != '0000':
-                return content.get('code', ""), content.get('msg', "")
-            else:
-                return content.get('data', {}).get('msg', "")
-        except requests.exceptions.RequestException as e:
-            return e
-        
+        # The whole body is a single "data:{...}" event
+        response = self._send("POST", "chat", json=data)
+        return _decode_event(response.content) or ""
+    
     def transcribe_video(
         self, 
         video_id: str, 
@@ -415,8 +762,7 @@ class MaviClient:
             "callBackUri": callback_uri if callback_uri else None
         }
                 
-        content = self._make_request("POST", "subTranscription", json=data)      
-        print(content)  
+        content = self._make_request("POST", "subTranscription", json=data)
         return content['data']['taskNo']
     
     def get_transcription(
@@ -466,4 +812,28 @@ class MaviClient:
             None
         """
         self._make_request("DELETE", "delete", json=video_ids)
-        
\ No newline at end of file
+        self._invalidate_metadata_cache()
+    
+    def delete_videos_parallel(
+        self,
+        video_ids: List[str],
+        max_workers: int = 8
+    ) -> None:
+        """Delete videos from the Mavi platform, issuing one concurrent request per video.
+        
+        Use this instead of :meth:`delete_video` when deleting many videos at once;
+        the requests share the client's pooled connections.
+        
+        Args:
+            video_ids (List[str]): List of video IDs to delete
+            max_workers (int, optional): Maximum number of concurrent requests, default is 8.
+                Values above POOL_MAXSIZE gain nothing, as extra connections are not kept alive.
+            
+        Returns:
+            None
+            
+        Raises:
+            MaviAPIError: If any of the deletions fails
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda video_id: self.delete_video([video_id]), video_ids))
@@ -0,0 +1,174 @@
+"""HTTP/2 Mavi API Client implementation."""
+
+import logging
+from typing import Optional, Dict, Generator, Tuple, Any
+
+try:
+    import httpx
+    import h2  # noqa: F401 - needed by httpx for http2=True
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+import orjson
+
+from .client import MaviClient, _decode_event, _status_error, _JSON_HEADERS
+from .exceptions import *
+
+logger = logging.getLogger(__name__)
+
+class MaviClientH2(MaviClient):
+    """Client for the Mavi Video AI Platform API that talks HTTP/2.
+
+    Behaves like :class:`MaviClient`, but sends every request over an ``httpx`` client
+    with HTTP/2 enabled, so concurrent requests from several threads (e.g. a streaming
+    chat alongside searches) are multiplexed on one connection instead of each holding
+    a connection of their own. Requires the optional ``httpx[http2]`` dependency
+    (``pip install pymavi[http2]``).
+
+    Unlike :class:`MaviClient`, only failed connection attempts are retried; busy
+    responses surface directly as :class:`MaviBusySystemError`.
+
+    Attributes:
+        api_key (str): The API key for authentication
+        base_url (str): The base URL for the Mavi API
+        session (httpx.Client): The HTTP/2 client used for requests
+    """
+
+    MAX_KEEPALIVE_CONNECTIONS = 10
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None, cache_ttl: float = 30):
+        """Initialize the HTTP/2 Mavi client.
+
+        Args:
+            api_key (str): Your Mavi API key
+            base_url (str, optional): Custom base URL for the API. Defaults to the standard URL.
+            cache_ttl (float, optional): Seconds to cache identical search_video_metadata results
+                for when the server sends no Cache-Control max-age, default is 30. 0 disables the cache.
+
+        Raises:
+            MaviValidationError: If the API key is empty or invalid
+            MaviError: If httpx or its HTTP/2 support (h2) is not installed
+        """
+        if httpx is None:
+            raise MaviError("MaviClientH2 requires httpx[http2]. Install it with `pip install pymavi[http2]`")
+        super().__init__(api_key, base_url, cache_ttl)
+
+    def _create_session(self) -> "httpx.Client":
+        """Create the HTTP/2 client shared by all requests of this client.
+
+        Returns:
+            httpx.Client: A client with the Authorization header set
+        """
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.POOL_MAXSIZE,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS
+            ),
+            retries=self.RETRY_TOTAL
+        )
+        # Uploads and chats can run for minutes, so like requests there is no timeout
+        return httpx.Client(
+            headers={"Authorization": self.api_key},
+            transport=transport,
+            timeout=None
+        )
+
+    def _mount_endpoint_adapters(self, session: "httpx.Client") -> None:
+        """httpx uses one transport for every endpoint, so there is nothing to mount."""
+        pass
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        allowed_statuses: Tuple[int, ...] = (),
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> "httpx.Response":
+        """Send an HTTP request to the Mavi API and check its status.
+
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            endpoint (str): API endpoint to call, one of _ENDPOINTS
+            allowed_statuses (tuple, optional): Error statuses to return to the caller instead of raising
+            params (dict, optional): Query parameters; entries set to None are dropped
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            httpx.Response: The successful response, or one with a status in allowed_statuses
+
+        Raises:
+            MaviAuthenticationError: If authentication fails
+            MaviAPIError: If the API request fails
+        """
+        url = self._urls[endpoint]
+
+        if params is not None:
+            # httpx sends None query values as empty strings, requests drops them
+            params = {k: v for k, v in params.items() if v is not None}
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**kwargs.get("headers", {}), **_JSON_HEADERS}
+
+        logger.debug("mavi request %s %s params=%s", method, url, params)
+        try:
+            response = self.session.request(method, url, params=params, **kwargs)
+        except httpx.HTTPError as e:
+            raise MaviAPIError(f"Request failed: {str(e)}") from e
+        if response.status_code >= 400 and response.status_code not in allowed_statuses:
+            raise _status_error(response.status_code, response.text)
+        return response
+
+    def _upload_file(
+        self,
+        video_path: str,
+        file_name: Optional[str],
+        callback_uri: Optional[str]
+    ) -> Tuple[str, str]:
+        """Helper method to upload a local video file
+
+        Args:
+            video_path (str): Path to the video file
+            file_name (str, optional): File name to send for the video, default is video_path
+            callback_uri (str, optional): Public callback URL for processing results
+
+        Returns:
+            tuple: A tuple containing the video ID and the video name assigned by Mavi
+        """
+        try:
+            with open(video_path, "rb") as video_file:
+                # httpx streams file fields from disk in chunks
+                files = {"file": (file_name or video_file.name, video_file, "video/mp4")}
+                params = {"callBackUri": callback_uri} if callback_uri else None
+                content = self._make_request("POST", "upload", files=files, params=params)
+                return (content['data']['videoNo'], content['data']['videoName'])
+        except FileNotFoundError:
+            raise MaviValidationError(f"Video file not found: {video_path}")
+
+    def _stream_response(
+        self,
+        url: str,
+        data: Dict[str, Any]
+    ) -> Generator[str, None, None]:
+        """Helper method to handle streaming responses
+
+        Args:
+            data (Dict[str, Any]): Data to send in the request
+
+        Returns:
+            Generator[str]: A generator yielding chunks of the response
+
+        Raises:
+            MaviAPIError: If the request fails or the assistant returns an error
+        """
+        logger.debug("mavi request POST %s (stream)", url)
+        try:
+            with self.session.stream("POST", url, content=orjson.dumps(data), headers=_JSON_HEADERS) as response:
+                if response.status_code >= 400:
+                    raise _status_error(response.status_code, response.read().decode(errors="replace"))
+                for line in response.iter_lines():
+                    message = _decode_event(line)
+                    if message is not None:
+                        yield message
+        except httpx.HTTPError as e:
+            raise MaviAPIError(f"Request failed: {str(e)}") from e